@@ -1,21 +1,59 @@
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
 from analogy.core.incidence_prevalence import Incidence, Prevalence
+from analogy.core.preprocessor import format_datatypes
 from analogy.utils.file_utils import save_dataframe
 from analogy.utils.formating import Arguments
 
 
-def run_incidence(data: pd.DataFrame, args: Arguments, destination_path: str) -> None:
+def preprocess(data: pd.DataFrame, args: Arguments) -> pd.DataFrame:
+    """
+    Format the study data column types once, so the incidence and prevalence analyses can share
+    the same typed dataframe instead of each parsing the dates again.
+    """
+    return format_datatypes(
+        data=data,
+        condition_cols=args["conditions"],
+        demography_cols=args["demography"],
+        patient_follow_up_cols=[args["patient_start_col"], args["patient_end_col"]],
+        date_format=args["date_format"],
+    )
+
+
+def run_incidence(
+    data: pd.DataFrame, args: Arguments, destination_path: str, file_format: str = "csv"
+) -> None:
     """ """
     incidence = Incidence(data, **args)
     output = incidence.analyse()
-    save_dataframe(output, destination_path, "incidence_analysis.csv")
+    save_dataframe(output, destination_path, "incidence_analysis.csv", file_format=file_format)
 
 
-def run_prevalence(data: pd.DataFrame, args: Arguments, destination_path: str) -> None:
+def run_prevalence(
+    data: pd.DataFrame, args: Arguments, destination_path: str, file_format: str = "csv"
+) -> None:
     """ """
     prevalence = Prevalence(data, **args)
     output = prevalence.analyse()
-    save_dataframe(output, destination_path, "prevalence_analysis.csv")
+    save_dataframe(output, destination_path, "prevalence_analysis.csv", file_format=file_format)
+
+
+def run_incidence_prevalence(
+    data: pd.DataFrame, args: Arguments, destination_path: str, file_format: str = "csv"
+) -> None:
+    """
+    Run the incidence and prevalence analyses concurrently on the same preprocessed dataframe.
+    The data is preprocessed here, before either thread starts, so raw input is never formatted
+    by both analyses at once; already typed data is left as it is. Both analyses then only read
+    the data and save to different files, and their numpy work releases the GIL.
+    """
+    data = preprocess(data, args)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(run_incidence, data, args, destination_path, file_format),
+            executor.submit(run_prevalence, data, args, destination_path, file_format),
+        ]
+        for future in futures:
+            future.result()
@@ -1,10 +1,9 @@
-from typing import Union
+from typing import Tuple, Union
 
 from abc import ABC, abstractmethod
 
 import numpy as np
-from scipy.special import ndtri
-from scipy.stats import chi2
+from scipy.special import chdtri, ndtri
 
 
 class BaseInterval(ABC):
@@ -22,6 +21,7 @@ class BaseInterval(ABC):
         """
         super().__init__()
         self.alpha = alpha
+        self._z = ndtri(1 - alpha / 2)
 
     @abstractmethod
     def lower_bound(self, numerator: Union[int, float], denominator: Union[int, float]) -> float:
@@ -43,6 +43,56 @@ class BaseInterval(ABC):
         """
         pass
 
+    def lower_bound_batch(self, numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """
+        Lower bounds for arrays of numerators and denominators. Subclasses override this with a
+        vectorised implementation, the default falls back to the scalar lower_bound.
+
+        Args:
+        ----
+          numerator (np.ndarray): the number of observed events.
+          denominator (np.ndarray): the denominator population at risk. Can be count or time.
+        """
+        numerator, denominator = np.broadcast_arrays(numerator, denominator)
+        return np.array(
+            [self.lower_bound(n, d) for n, d in zip(numerator, denominator)], dtype=np.float64
+        )
+
+    def upper_bound_batch(self, numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """
+        Upper bounds for arrays of numerators and denominators. Subclasses override this with a
+        vectorised implementation, the default falls back to the scalar upper_bound.
+
+        Args:
+        ----
+          numerator (np.ndarray): the number of observed events.
+          denominator (np.ndarray): the denominator population at risk. Can be count or time.
+        """
+        numerator, denominator = np.broadcast_arrays(numerator, denominator)
+        return np.array(
+            [self.upper_bound(n, d) for n, d in zip(numerator, denominator)], dtype=np.float64
+        )
+
+    def bounds(
+        self, numerator: np.ndarray, denominator: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lower and upper bounds for arrays of numerators and denominators.
+
+        Args:
+        ----
+          numerator (np.ndarray): the number of observed events.
+          denominator (np.ndarray): the denominator population at risk. Can be count or time.
+
+        Returns:
+        -------
+          tuple (lower_ci, upper_ci) of arrays.
+        """
+        return (
+            self.lower_bound_batch(numerator, denominator),
+            self.upper_bound_batch(numerator, denominator),
+        )
+
 
 class ChiSquaredConfidenceInterval(BaseInterval):
     """
@@ -81,16 +131,35 @@ class ChiSquaredConfidenceInterval(BaseInterval):
     def upper_bound(self, numerator: Union[int, float], denominator: Union[int, float]) -> float:
         if numerator is None:
             return 0.0
-        b = chi2.ppf(1 - (self.alpha / 2), 2 * numerator + 2) / 2
-        upper_ci: float = b / denominator
-        return upper_ci
+        upper_ci = self.upper_bound_batch(np.atleast_1d(numerator), np.atleast_1d(denominator))
+        return float(upper_ci[0])
 
     def lower_bound(self, numerator: Union[int, float], denominator: Union[int, float]) -> float:
         if numerator is None:
             return 0.0
-        b = chi2.ppf((self.alpha / 2), (numerator * 2)) / 2
-        lower_ci: float = b / denominator
-        return lower_ci
+        lower_ci = self.lower_bound_batch(np.atleast_1d(numerator), np.atleast_1d(denominator))
+        return float(lower_ci[0])
+
+    def upper_bound_batch(self, numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        # chdtri is the inverse survival function, so chi2.ppf(q, df) == chdtri(df, 1 - q).
+        numerator = np.asarray(numerator, dtype=np.float64)
+        return (chdtri(2 * numerator + 2, self.alpha / 2) / 2) / denominator
+
+    def lower_bound_batch(self, numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        numerator = np.asarray(numerator, dtype=np.float64)
+        return (chdtri(numerator * 2, 1 - (self.alpha / 2)) / 2) / denominator
+
+    def bounds(
+        self, numerator: np.ndarray, denominator: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        numerator = np.asarray(numerator, dtype=np.float64)
+        # a single chdtri call evaluates both percentiles for every numerator; the percentiles
+        # are shaped to broadcast along the leading stacked axis whatever the input shape is.
+        percentiles = np.reshape(
+            [1 - (self.alpha / 2), self.alpha / 2], (2,) + (1,) * numerator.ndim
+        )
+        b = chdtri(np.stack([numerator * 2, 2 * numerator + 2]), percentiles)
+        return (b[0] / 2) / denominator, (b[1] / 2) / denominator
 
 
 class ByarsConfidenceInterval(BaseInterval):
@@ -141,28 +210,41 @@ class ByarsConfidenceInterval(BaseInterval):
     def upper_bound(self, numerator: Union[int, float], denominator: Union[int, float]) -> float:
         if numerator is None:
             return 0.0
-
-        if numerator < 10:
-            upper_ci = self.chi_squared.upper_bound(numerator, denominator)
-        else:
-            z = ndtri(1 - self.alpha / 2)
-            c = 1 / (9 * (numerator + 1))
-            b = 3 * (np.sqrt(numerator + 1))
-            upper_o = (numerator + 1) * ((1 - c + (z / b)) ** 3)
-            upper_ci = upper_o / denominator
-        return upper_ci
+        upper_ci = self.upper_bound_batch(np.atleast_1d(numerator), np.atleast_1d(denominator))
+        return float(upper_ci[0])
 
     def lower_bound(self, numerator: Union[int, float], denominator: Union[int, float]) -> float:
-
         if numerator is None:
             return 0.0
+        lower_ci = self.lower_bound_batch(np.atleast_1d(numerator), np.atleast_1d(denominator))
+        return float(lower_ci[0])
+
+    def upper_bound_batch(self, numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        numerator = np.asarray(numerator, dtype=np.float64)
+        denominator = np.broadcast_to(np.asarray(denominator, dtype=np.float64), numerator.shape)
+        upper_ci = np.empty_like(numerator)
+
+        exact = numerator < 10
+        upper_ci[exact] = self.chi_squared.upper_bound_batch(numerator[exact], denominator[exact])
+
+        observed = numerator[~exact] + 1
+        c = 1 / (9 * observed)
+        b = 3 * np.sqrt(observed)
+        upper_o = observed * ((1 - c + (self._z / b)) ** 3)
+        upper_ci[~exact] = upper_o / denominator[~exact]
+        return upper_ci
+
+    def lower_bound_batch(self, numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        numerator = np.asarray(numerator, dtype=np.float64)
+        denominator = np.broadcast_to(np.asarray(denominator, dtype=np.float64), numerator.shape)
+        lower_ci = np.empty_like(numerator)
+
+        exact = numerator < 10
+        lower_ci[exact] = self.chi_squared.lower_bound_batch(numerator[exact], denominator[exact])
 
-        if numerator < 10:
-            lower_ci = self.chi_squared.lower_bound(numerator, denominator)
-        else:
-            z = ndtri(1 - self.alpha / 2)
-            c = 1 / (9 * numerator)
-            b = 3 * np.sqrt(numerator)
-            lower_o = numerator * ((1 - c - (z / b)) ** 3)
-            lower_ci = lower_o / denominator
+        observed = numerator[~exact]
+        c = 1 / (9 * observed)
+        b = 3 * np.sqrt(observed)
+        lower_o = observed * ((1 - c - (self._z / b)) ** 3)
+        lower_ci[~exact] = lower_o / denominator[~exact]
         return lower_ci
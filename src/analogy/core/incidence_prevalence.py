@@ -1,7 +1,10 @@
-from typing import List, Tuple, Type, Union
+from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar, Union
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 from tqdm import tqdm
@@ -10,6 +13,356 @@ from analogy.core.confidence_interval import BaseInterval, ByarsConfidenceInterv
 from analogy.core.preprocessor import convert_str_to_datetime, format_datatypes
 from analogy.data import load_sample_data
 
+_NS_PER_DAY = 86_400_000_000_000
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+_INT32_MIN = np.iinfo(np.int32).min
+_INT32_MAX = np.iinfo(np.int32).max
+# upper bound on the number of (patient, period) cells evaluated at once.
+_MAX_BLOCK_CELLS = 1 << 22
+
+T = TypeVar("T")
+
+INCIDENCE_COLUMNS = [
+    "Condition",
+    "Date",
+    "Group",
+    "Subgroup",
+    "Incidence",
+    "Numerator",
+    "Denominator",
+    "Lower_CI",
+    "Upper_CI",
+]
+PREVALENCE_COLUMNS = [
+    "Condition",
+    "Date",
+    "Group",
+    "Subgroup",
+    "Prevalence",
+    "Numerator",
+    "Denominator",
+    "Lower_CI",
+    "Upper_CI",
+]
+
+
+def _to_int64(column: pd.Series, missing: int) -> np.ndarray:
+    """
+    Function to view a datetime column as int64 nanoseconds. A datetime64[ns] column is viewed
+    without copying; other units and Arrow-backed timestamps are converted once.
+
+    Args:
+        column (Series): datetime column.
+        missing (int): value to use for missing dates.
+
+    Returns:
+        array (np.ndarray): int64 nanoseconds since epoch.
+    """
+    values = column.to_numpy(dtype="datetime64[ns]").view("i8")
+    # NaT is stored as the smallest int64, so only other sentinels need a replacement pass.
+    if missing == _INT64_MIN:
+        return values
+    return np.where(values == _INT64_MIN, missing, values)
+
+
+def _map_conditions(function: Callable[[str], T], conditions: List[str], n_jobs: int) -> List[T]:
+    """
+    Function to apply function to every condition column, on n_jobs threads. The incidence and
+    prevalence kernels spend their time in numpy, which releases the GIL, so threads run in
+    parallel without copying the data to worker processes.
+
+    Args:
+        function (Callable): calculation to run for a single condition column.
+        conditions (List[str]): condition columns.
+        n_jobs (int): number of threads to use, -1 uses one thread per CPU.
+
+    Returns:
+        results (List): function output for each condition, in the order of conditions.
+    """
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs == 1 or len(conditions) <= 1:
+        return [function(condition_col) for condition_col in tqdm(conditions)]
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return list(tqdm(executor.map(function, conditions), total=len(conditions)))
+
+
+def _check_n_jobs(n_jobs: int) -> int:
+    """
+    Function to validate the number of threads, which is -1 for one thread per CPU or a positive
+    count.
+
+    Raises:
+        ValueError: n_jobs is 0 or below -1.
+    """
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError(
+            f"n_jobs must be -1 (one thread per CPU) or a positive number of threads, got {n_jobs}."
+        )
+    return n_jobs
+
+
+def _period_starts(
+    study_start_date: datetime, study_end_date: datetime, increment_by_months: int
+) -> pd.DatetimeIndex:
+    """
+    Function to generate the start date of every study period.
+
+    Args:
+        study_start_date (datetime): start date of the study.
+        study_end_date (datetime): exclusive end date of the study.
+        increment_by_months (int): number of months in each period.
+
+    Returns:
+        period_start (DatetimeIndex): start of each period, before study_end_date.
+    """
+    return pd.date_range(
+        study_start_date,
+        study_end_date,
+        freq=pd.DateOffset(months=increment_by_months),
+        inclusive="left",
+    )
+
+
+def _covering_counts(lower: np.ndarray, upper: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Function to count how many closed intervals [lower, upper] contain each point, using two
+    binary searches per point on the sorted interval bounds.
+
+    Args:
+        lower (np.ndarray): int64 start of each interval.
+        upper (np.ndarray): int64 end of each interval, empty intervals (upper < lower) are ignored.
+        points (np.ndarray): int64 points to count intervals for.
+
+    Returns:
+        counts (np.ndarray): number of intervals containing each point.
+    """
+    keep = lower <= upper
+    started = np.searchsorted(np.sort(lower[keep]), points, side="right")
+    ended = np.searchsorted(np.sort(upper[keep]), points, side="left")
+    return started - ended
+
+
+def _prevalent_counts(
+    patient_start: np.ndarray, patient_end: np.ndarray, condition: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    """
+    Function to count patients in follow-up with the condition recorded at each point. A patient
+    is prevalent on every date in [max(patient_start, condition), patient_end], so the counts
+    come from binary searches on sorted bounds instead of a scan of every patient per point.
+
+    Args:
+        patient_start (np.ndarray): follow-up start as int64 nanoseconds, missing as int64 max.
+        patient_end (np.ndarray): follow-up end as int64 nanoseconds, missing as int64 min.
+        condition (np.ndarray): condition date as int64 nanoseconds, missing as int64 max.
+        points (np.ndarray): int64 nanosecond dates to calculate prevalence on.
+
+    Returns:
+        counts (np.ndarray): numerator for each point.
+    """
+    return _covering_counts(np.maximum(patient_start, condition), patient_end, points)
+
+
+def _group_membership(
+    data: pd.DataFrame, demography: List[str]
+) -> Tuple[List[Tuple[str, Any]], np.ndarray]:
+    """
+    Function to build the subgroup membership of every patient from categorical demography columns.
+
+    Args:
+        data (DataFrame): study data with categorical demography columns.
+        demography (List[str]): demography columns to group by.
+
+    Returns:
+        tuple (groups, membership): list of (demography column, category) and a boolean
+        (patients, groups) matrix with one column per entry of groups.
+    """
+    groups: List[Tuple[str, Any]] = []
+    masks = []
+    for demo in demography:
+        categories = data[demo].cat.categories
+        groups.extend((demo, name) for name in categories)
+        masks.append(np.equal.outer(data[demo].cat.codes.to_numpy(), np.arange(len(categories))))
+    membership = np.hstack(masks) if masks else np.zeros((len(data), 0), dtype=bool)
+    return groups, membership
+
+
+def _group_order(codes: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function to sort patients by their category code so every subgroup is a contiguous slice.
+
+    Args:
+        codes (np.ndarray): category code of every patient, -1 for missing values.
+        n_groups (int): number of categories.
+
+    Returns:
+        tuple (order, bounds): patient order and the boundaries such that
+        order[bounds[i] : bounds[i + 1]] are the patients of category i. Missing values are left out.
+    """
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(n_groups + 1))
+    return order, bounds
+
+
+def _may_be_at_risk(
+    patient_start: np.ndarray,
+    patient_end: np.ndarray,
+    condition: np.ndarray,
+    period_start: np.ndarray,
+    period_end: np.ndarray,
+) -> np.ndarray:
+    """
+    Function to flag patients that may be at risk in some of the given periods, checked once
+    against the span from the earliest period start to the latest period end.
+
+    Returns:
+        boolean array with one entry per patient.
+    """
+    first, last = period_start.min(), period_end.max()
+    return (
+        (patient_end >= first)
+        & (patient_start < last)
+        & (condition >= first)
+        & (condition > patient_start)
+    )
+
+
+def _whole_days(*arrays: np.ndarray) -> Optional[List[np.ndarray]]:
+    """
+    Function to convert int64 nanosecond arrays to int32 day numbers when every date falls on
+    midnight, so day differences equal the floored nanosecond differences. Missing values keep
+    their place at either end of the range.
+
+    Returns:
+        list of int32 arrays, or None if any date has a time of day.
+    """
+    converted = []
+    for values in arrays:
+        low = values == _INT64_MIN
+        high = values == _INT64_MAX
+        days, remainder = np.divmod(values, _NS_PER_DAY)
+        if np.any(remainder[~(low | high)]):
+            return None
+        days = days.astype(np.int32)
+        days[low] = _INT32_MIN
+        days[high] = _INT32_MAX
+        converted.append(days)
+    return converted
+
+
+def _incidence_counts(
+    patient_start: np.ndarray,
+    patient_end: np.ndarray,
+    condition: np.ndarray,
+    period_start: np.ndarray,
+    period_end: np.ndarray,
+    membership: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function to calculate the incidence numerator and person-time for all periods in one pass.
+    Patients are broadcast against blocks of periods so memory stays bounded by _MAX_BLOCK_CELLS,
+    and each block is reduced once per group with a single matrix product.
+
+    Args:
+        patient_start (np.ndarray): follow-up start as int64 nanoseconds, missing as int64 max.
+        patient_end (np.ndarray): follow-up end as int64 nanoseconds, missing as int64 min.
+        condition (np.ndarray): condition date as int64 nanoseconds, missing as int64 max.
+        period_start (np.ndarray): start of each period as int64 nanoseconds.
+        period_end (np.ndarray): exclusive end of each period as int64 nanoseconds.
+        membership (np.ndarray): optional boolean (patients, groups) matrix. Default: all patients
+            in a single group.
+
+    Returns:
+        tuple (numerators, person_time) of (groups, periods) arrays.
+    """
+    if membership is None:
+        membership = np.ones((len(patient_start), 1), dtype=bool)
+
+    numerators = np.zeros((membership.shape[1], len(period_start)), dtype=np.float64)
+    person_time = np.zeros((membership.shape[1], len(period_start)), dtype=np.float64)
+    if len(period_start) == 0:
+        return numerators.astype(np.int64), person_time
+
+    # patients that cannot be at risk in any period only ever add zeros, so they are dropped
+    # before anything is broadcast against the periods.
+    eligible = np.flatnonzero(
+        _may_be_at_risk(patient_start, patient_end, condition, period_start, period_end)
+    )
+    patient_start = patient_start[eligible]
+    patient_end = patient_end[eligible]
+    condition = condition[eligible]
+    weights = membership[eligible].T.astype(np.float64)
+
+    # with date-only data all comparisons and differences run on int32 day numbers instead.
+    period_days = (period_end - period_start) // _NS_PER_DAY
+    day_numbers = _whole_days(patient_start, patient_end, condition, period_start, period_end)
+    if day_numbers is not None:
+        patient_start, patient_end, condition, period_start, period_end = day_numbers
+
+    follow_up_end = np.minimum(patient_end, condition)
+    onset_after_start = condition > patient_start
+
+    # block buffers are allocated once and every predicate is evaluated in place, so the
+    # loop below does not create any (patients, periods) temporaries; per block it only gathers
+    # the (patients,) columns of the rows overlapping the block.
+    patients = len(patient_start)
+    step = min(max(1, _MAX_BLOCK_CELLS // max(patients, 1)), len(period_start))
+    weights_buffer = np.empty(weights.size, dtype=np.float64)
+    at_risk_buffer = np.empty(patients * step, dtype=bool)
+    event_buffer = np.empty(patients * step, dtype=bool)
+    entry_buffer = np.empty(patients * step, dtype=patient_start.dtype)
+    leave_buffer = np.empty(patients * step, dtype=patient_start.dtype)
+    days_buffer = np.empty(patients * step, dtype=np.float64)
+
+    for lo in range(0, len(period_start), step):
+        start = period_start[lo : lo + step]
+        end = period_end[lo : lo + step]
+
+        # only patients overlapping this block of periods can count towards it; a block with
+        # nobody at risk keeps its zeros and skips the broadcasting entirely.
+        rows = np.flatnonzero(_may_be_at_risk(patient_start, patient_end, condition, start, end))
+        if len(rows) == 0:
+            continue
+        shape = (len(rows), len(start))
+        cells = shape[0] * shape[1]
+        at_risk = at_risk_buffer[:cells].reshape(shape)
+        event = event_buffer[:cells].reshape(shape)
+        entry = entry_buffer[:cells].reshape(shape)
+        leave = leave_buffer[:cells].reshape(shape)
+        days = days_buffer[:cells].reshape(shape)
+
+        start_col = patient_start[rows, None]
+        condition_col = condition[rows, None]
+        block_weights = weights_buffer[: len(weights) * len(rows)].reshape(len(weights), len(rows))
+        np.take(weights, rows, axis=1, out=block_weights, mode="clip")
+
+        np.greater_equal(patient_end[rows, None], start, out=at_risk)
+        np.less(start_col, end, out=event)
+        at_risk &= event
+        np.greater_equal(condition_col, start, out=event)
+        at_risk &= event
+        at_risk &= onset_after_start[rows, None]
+        np.less(condition_col, end, out=event)
+        event &= at_risk
+        # matmul would cast a bool operand to a float64 copy, so the events go through the
+        # float64 days buffer before it is used for the person-time.
+        np.copyto(days, event)
+        numerators[:, lo : lo + step] = block_weights @ days
+
+        np.maximum(start_col, start, out=entry)
+        np.minimum(follow_up_end[rows, None], end, out=leave)
+        if day_numbers is not None:
+            np.subtract(leave, entry, out=days)
+        else:
+            leave -= entry
+            np.floor_divide(leave, _NS_PER_DAY, out=days)
+        days *= at_risk
+        person_time[:, lo : lo + step] = block_weights @ days
+
+    person_time /= period_days
+    return numerators.round().astype(np.int64), person_time
+
 
 class Incidence:
     """
@@ -26,13 +379,14 @@ class Incidence:
       patient_end_col (str): column for the end date for patient follow-up
 
     Optional Args:
-      conditions (List[str]): Default: []. Defines the list of columns for the base event dates.
-      demography (List[str]): Default: []. Defines columns to use as grouping variables.
+      conditions (List[str]): Default: None. Defines the list of columns for the base event dates.
+      demography (List[str]): Default: None. Defines columns to use as grouping variables.
       person_years (int): Default: 1.0. Number of person years to scale by incidence rates by.
       alpha (float): Default: 0.05. Significance level for calulating error using Byar's method.
       increment_by_months (int): Default: 12. Number of months in each incidence calculation. By default returns yearly incidence rates.
       confidence_method (BaseInterval): Default: ByarsConfidenceInterval. Method to use for calculating confidence Interval.
       date_format (str): Default: 'ISO8601': the date format stored in the dataset.
+      n_jobs (int): Default: 1. Number of threads used to analyse conditions in parallel, -1 uses all CPUs.
     Returns:
       aggregated_df (pd.DataFrame): Aggregated Incidence rates with columns [Date, Group, Sub Group, Rate, Numerator, Denominator, CI_lower, CI_upper]
     """
@@ -44,14 +398,17 @@ class Incidence:
         study_end_date: str,
         patient_start_col: str,
         patient_end_col: str,
-        conditions: List[str] = [],
-        demography: List[str] = [],
+        conditions: Optional[List[str]] = None,
+        demography: Optional[List[str]] = None,
         person_years: Union[int, float] = 1.0,
         alpha: float = 0.05,
         increment_by_months: int = 12,
         confidence_method: Type[BaseInterval] = ByarsConfidenceInterval,
         date_format: str = "ISO8601",
+        n_jobs: int = 1,
     ) -> None:
+        conditions = list(conditions or [])
+        demography = list(demography or [])
         self.data = format_datatypes(
             data=data,
             condition_cols=conditions,
@@ -59,8 +416,6 @@ class Incidence:
             date_format=date_format,
             patient_follow_up_cols=[patient_start_col, patient_end_col],
         )
-        self.__analysis_overall = None
-        self.__analysis_subgroup = None
         self.study_start_date = convert_str_to_datetime(study_start_date, format=date_format)
         self.study_end_date = convert_str_to_datetime(
             study_end_date, format=date_format
@@ -72,7 +427,88 @@ class Incidence:
         self.person_years = person_years
         self.increment_by_months = increment_by_months
         self.dateformat = date_format
-        self.confidence_method = confidence_method()
+        self.n_jobs = _check_n_jobs(n_jobs)
+        self.confidence_method = confidence_method(alpha=alpha)
+
+    def study_periods(self) -> Tuple[pd.DatetimeIndex, pd.DatetimeIndex]:
+        """
+        Function definition for the incidence periods between study start and end dates.
+
+        Return:
+            tuple (period start, period end)
+        """
+        period_start = _period_starts(
+            self.study_start_date, self.study_end_date, self.increment_by_months
+        )
+        period_end = period_start + pd.DateOffset(months=self.increment_by_months)
+        period_end = pd.DatetimeIndex(
+            np.minimum(period_end.to_numpy(), np.datetime64(self.study_end_date, "ns"))
+        )
+        return period_start, period_end
+
+    def _incidence_rows(
+        self,
+        period_start: pd.DatetimeIndex,
+        numerators: np.ndarray,
+        person_time: np.ndarray,
+        condition_col: str,
+        group: str = "Overall",
+        sub_group: Any = "",
+    ) -> List[Tuple[str, str, str, str, float, int, float, float, float]]:
+        """
+        Function definition to turn per period numerators and person-time into result rows.
+        """
+        denominators = person_time + 1e-8
+        point_inc = (numerators / denominators) * self.person_years
+        lower_ci, upper_ci = self.confidence_method.bounds(numerators, denominators)
+        dates = period_start.normalize().strftime(self.dateformat)
+
+        return [
+            (
+                condition_col,
+                dates[i],
+                group,
+                sub_group,
+                float(point_inc[i]),
+                int(numerators[i]),
+                float(denominators[i]),
+                float(lower_ci[i] * self.person_years),
+                float(upper_ci[i] * self.person_years),
+            )
+            for i in range(len(period_start))
+        ]
+
+    def incidence_by_period(
+        self,
+        dataframe: pd.DataFrame,
+        period_start: pd.DatetimeIndex,
+        period_end: pd.DatetimeIndex,
+        condition_col: str,
+        group: str = "Overall",
+        sub_group: str = "",
+    ) -> List[Tuple[str, str, str, str, float, int, float, float, float]]:
+        """
+        Function definition for incidence calculation over several periods at once.
+
+        Args:
+            dataframe: the full or grouped pandas dataframe.
+            period_start: datetime values to start calculating incidence from.
+            period_end: datetime values to end calculating incidence on.
+            condition_col: baseline variable column name.
+
+        Return:
+            list of tuples (condition, year, group, subgroup, incidence rate, numerator, denominator, lower_ci, upper_ci)
+        """
+        numerators, person_time = _incidence_counts(
+            _to_int64(dataframe[self.patient_start_col], _INT64_MAX),
+            _to_int64(dataframe[self.patient_end_col], _INT64_MIN),
+            _to_int64(dataframe[condition_col], _INT64_MAX),
+            period_start.asi8,
+            period_end.asi8,
+        )
+        return self._incidence_rows(
+            period_start, numerators[0], person_time[0], condition_col, group, sub_group
+        )
 
     def period_incidence(
         self,
@@ -96,140 +532,86 @@ class Incidence:
             tuple (year, incidence rate, denominator, numerator, lower_ci, upper_ci, error_delta, count)
 
         """
-
-        numerator = len(
-            dataframe[
-                (dataframe[condition_col].between(start_yr, end_yr, inclusive="left"))
-                & (dataframe[self.patient_end_col] >= start_yr)
-                & (dataframe[self.patient_start_col] < end_yr)
-                & (dataframe[condition_col] > dataframe[self.patient_start_col])
-            ]
-        )
-        denominator_df = dataframe[
-            (
-                (dataframe[self.patient_end_col] >= start_yr)
-                & (dataframe[self.patient_start_col] < end_yr)
-            )
-            & (
-                (dataframe[condition_col] >= start_yr)
-                & (dataframe[condition_col] > dataframe[self.patient_start_col])
-                | (dataframe[condition_col].isna())
-            )
-        ]
-
-        start_period = denominator_df[self.patient_start_col].where(
-            denominator_df[self.patient_start_col] > start_yr, start_yr
-        )
-        end_period = denominator_df[[self.patient_end_col, condition_col]].min(axis=1)
-        end_period = end_period.where(end_period < end_yr, end_yr)
-        delta = end_yr - start_yr
-        time_contributed = (end_period - start_period).dt.days / delta.days
-
-        denominator = float(time_contributed.sum() + 1e-8)
-
-        point_inc = float((numerator / denominator) * self.person_years)
-
-        lower_ci = self.confidence_method.lower_bound(numerator, denominator)
-        upper_ci = self.confidence_method.upper_bound(numerator, denominator)
-
-        return (
+        return self.incidence_by_period(
+            dataframe,
+            pd.DatetimeIndex([start_yr]),
+            pd.DatetimeIndex([end_yr]),
             condition_col,
-            start_yr.date().strftime(self.dateformat),
             group,
             sub_group,
-            point_inc,
-            numerator,
-            denominator,
-            lower_ci * self.person_years,
-            upper_ci * self.person_years,
-        )
+        )[0]
 
-    def calculate_overall_incidence(self) -> pd.DataFrame:
+    def _overall_incidence_rows(
+        self,
+    ) -> List[Tuple[str, str, str, str, float, int, float, float, float]]:
         """
-        Function definition for overall incidence rate calculation.
+        Function definition for the overall incidence rows of every condition.
         """
-        overall_df_list = []
         print("Calculating overall incidence rate.")
-        for condition_col in tqdm(self.conditions):
-            df_list = []
-            current_period = self.study_start_date
-            while current_period < self.study_end_date:
-                delta = relativedelta(months=self.increment_by_months)
-                end_period = min(self.study_end_date, current_period + delta)
-                year_tuple = self.period_incidence(
-                    self.data, current_period, end_period, condition_col
-                )
-                df_list.append(year_tuple)
-                current_period += delta
-            overall_df_list.append(
-                pd.DataFrame(
-                    df_list,
-                    columns=[
-                        "Condition",
-                        "Date",
-                        "Group",
-                        "Subgroup",
-                        "Incidence",
-                        "Numerator",
-                        "Denominator",
-                        "Lower_CI",
-                        "Upper_CI",
-                    ],
-                )
-            )
+        period_start, period_end = self.study_periods()
 
-        if len(overall_df_list) > 0:
-            self.__analysis_overall = pd.concat(overall_df_list)
-        else:
-            self.__analysis_overall = pd.DataFrame()
-        return self.__analysis_overall
+        def condition_incidence(
+            condition_col: str,
+        ) -> List[Tuple[str, str, str, str, float, int, float, float, float]]:
+            return self.incidence_by_period(self.data, period_start, period_end, condition_col)
 
-    def calculate_grouped_incidence(self) -> pd.DataFrame:
+        rows = []
+        for condition_rows in _map_conditions(condition_incidence, self.conditions, self.n_jobs):
+            rows.extend(condition_rows)
+        return rows
+
+    def _grouped_incidence_rows(
+        self,
+    ) -> List[Tuple[str, str, str, str, float, int, float, float, float]]:
         """
-        Function definition for subgroup incidence rate calculation.
+        Function definition for the subgroup incidence rows of every condition.
         """
-        overall_df_list = []
         print("Calculating incidence rate by subgroup demography.")
-        for condition_col in tqdm(self.conditions):
-            for demo in self.demography:
-                subgroup_list = []
-                for name, group in self.data.groupby(demo, observed=False):
-                    current_period = self.study_start_date
-                    while current_period < self.study_end_date:
-                        delta = relativedelta(months=self.increment_by_months)
-                        end_period = min(self.study_end_date, current_period + delta)
-                        year_tuple = self.period_incidence(
-                            group, current_period, end_period, condition_col, demo, name
-                        )
-                        subgroup_list.append(year_tuple)
-                        current_period += delta
-                group_df = pd.DataFrame(
-                    subgroup_list,
-                    columns=[
-                        "Condition",
-                        "Date",
-                        "Group",
-                        "Subgroup",
-                        "Incidence",
-                        "Numerator",
-                        "Denominator",
-                        "Lower_CI",
-                        "Upper_CI",
-                    ],
+        period_start, period_end = self.study_periods()
+        groups, membership = _group_membership(self.data, self.demography)
+        patient_start = _to_int64(self.data[self.patient_start_col], _INT64_MAX)
+        patient_end = _to_int64(self.data[self.patient_end_col], _INT64_MIN)
+
+        def condition_incidence(
+            condition_col: str,
+        ) -> List[Tuple[str, str, str, str, float, int, float, float, float]]:
+            numerators, person_time = _incidence_counts(
+                patient_start,
+                patient_end,
+                _to_int64(self.data[condition_col], _INT64_MAX),
+                period_start.asi8,
+                period_end.asi8,
+                membership,
+            )
+            subgroup_list = []
+            for i, (demo, name) in enumerate(groups):
+                subgroup_list.extend(
+                    self._incidence_rows(
+                        period_start, numerators[i], person_time[i], condition_col, demo, name
+                    )
                 )
-                overall_df_list.append(group_df)
+            return subgroup_list
 
-        if len(overall_df_list) > 0:
-            self.__analysis_subgroup = pd.concat(overall_df_list)
-        else:
-            self.__analysis_subgroup = pd.DataFrame()
+        rows = []
+        for condition_rows in _map_conditions(condition_incidence, self.conditions, self.n_jobs):
+            rows.extend(condition_rows)
+        return rows
 
-        return self.__analysis_subgroup
+    def calculate_overall_incidence(self) -> pd.DataFrame:
+        """
+        Function definition for overall incidence rate calculation.
+        """
+        return pd.DataFrame(self._overall_incidence_rows(), columns=INCIDENCE_COLUMNS)
+
+    def calculate_grouped_incidence(self) -> pd.DataFrame:
+        """
+        Function definition for subgroup incidence rate calculation.
+        """
+        return pd.DataFrame(self._grouped_incidence_rows(), columns=INCIDENCE_COLUMNS)
 
     def analyse(self) -> pd.DataFrame:
-        overall_df = self.calculate_overall_incidence()
-        subgroup_df = self.calculate_grouped_incidence()
-        return pd.concat([overall_df, subgroup_df])
+        rows = self._overall_incidence_rows() + self._grouped_incidence_rows()
+        return pd.DataFrame(rows, columns=INCIDENCE_COLUMNS)
 
 
 class Prevalence:
@@ -247,13 +629,14 @@ class Prevalence:
       patient_end_col (str): column for the end date for patient follow-up
 
     Optional Args:
-      conditions (List[str]): Default: []. Defines the list of columns for the base event dates.
-      demography (List[str]): Default: []. Defines columns to use as grouping variables.
+      conditions (List[str]): Default: None. Defines the list of columns for the base event dates.
+      demography (List[str]): Default: None. Defines columns to use as grouping variables.
       person_years (int): Default: 1.0. Number of person years to scale by incidence rates by.
       alpha (float): Default: 0.05. Significance level for calulating error using Byar's method.
       increment_by_months (int): Default: 12. Number of months in each incidence calculation. By default returns yearly incidence rates.
       confidence_method (BaseInterval): Default: ByarsConfidenceInterval. Method to use for calculating confidence Interval.
       date_format (str): Default: 'ISO8601': the date format stored in the dataset.
+      n_jobs (int): Default: 1. Number of threads used to analyse conditions in parallel, -1 uses all CPUs.
     Returns:
       aggregated_df (pd.DataFrame): Aggregated Incidence rates with columns [Date, Group, Sub Group, Rate, Numerator, Denominator, CI_lower, CI_upper]
     """
@@ -265,14 +648,17 @@ class Prevalence:
         study_end_date: str,
         patient_start_col: str,
         patient_end_col: str,
-        conditions: List[str] = [],
-        demography: List[str] = [],
+        conditions: Optional[List[str]] = None,
+        demography: Optional[List[str]] = None,
         person_years: Union[int, float] = 1.0,
         alpha: float = 0.05,
         increment_by_months: int = 12,
         confidence_method: Type[BaseInterval] = ByarsConfidenceInterval,
         date_format: str = "ISO8601",
+        n_jobs: int = 1,
     ) -> None:
+        conditions = list(conditions or [])
+        demography = list(demography or [])
         self.data = format_datatypes(
             data=data,
             condition_cols=conditions,
@@ -280,8 +666,6 @@ class Prevalence:
             date_format=date_format,
             patient_follow_up_cols=[patient_start_col, patient_end_col],
         )
-        self.__analysis_overall = None
-        self.__analysis_subgroup = None
         self.study_start_date = convert_str_to_datetime(study_start_date, format=date_format)
         self.study_end_date = convert_str_to_datetime(
             study_end_date, format=date_format
@@ -293,6 +677,7 @@ class Prevalence:
         self.person_years = person_years
         self.increment_by_months = increment_by_months
         self.dateformat = date_format
+        self.n_jobs = _check_n_jobs(n_jobs)
         self.confidence_method = confidence_method(alpha=alpha)
 
     def point_prevalence(
@@ -316,131 +701,156 @@ class Prevalence:
 
         """
 
-        # event that occured before the year of interest which is a combination of outcome recording that is
-        # before that year of interest
-        numerator = float(
-            len(
-                dataframe[
-                    (
-                        (dataframe[self.patient_start_col] <= start_yr)
-                        & (dataframe[self.patient_end_col] >= start_yr)
-                    )
-                    & (dataframe[condition_col] <= start_yr)
-                ]
-            )
-        )
-
-        # Patients who are in the practice at the start of the interested year, that is they enter the cohort
-        # before the start of the interested year and have not exited before the start of the interested year
-        denominator = float(
-            len(
-                dataframe[
-                    (dataframe[self.patient_start_col] <= start_yr)
-                    & (dataframe[self.patient_end_col] >= start_yr)
-                ]
-            )
-        )
-
-        denominator = denominator + 1e-8  # adding a small constant to avoid division by zero.
-        point_prev = (numerator / denominator) * self.person_years
-
-        lower_ci = self.confidence_method.lower_bound(numerator, denominator)
-        upper_ci = self.confidence_method.upper_bound(numerator, denominator)
-
-        return (
+        patient_start = _to_int64(dataframe[self.patient_start_col], _INT64_MAX)
+        patient_end = _to_int64(dataframe[self.patient_end_col], _INT64_MIN)
+        points = pd.DatetimeIndex([start_yr])
+        return self._prevalence_rows(
+            points,
+            _prevalent_counts(
+                patient_start,
+                patient_end,
+                _to_int64(dataframe[condition_col], _INT64_MAX),
+                points.asi8,
+            ),
+            _covering_counts(patient_start, patient_end, points.asi8),
             condition_col,
-            start_yr.date().strftime(self.dateformat),
             group,
             sub_group,
-            point_prev,
-            int(numerator),
-            int(denominator),
-            lower_ci * self.person_years,
-            upper_ci * self.person_years,
-        )
+        )[0]
 
-    def calculate_overall_prevalence(self) -> pd.DataFrame:
+    def _prevalence_rows(
+        self,
+        period_start: pd.DatetimeIndex,
+        numerators: np.ndarray,
+        denominators: np.ndarray,
+        condition_col: str,
+        group: str = "Overall",
+        sub_group: Any = "",
+    ) -> List[Tuple[str, str, str, str, float, int, int, float, float]]:
         """
-        Function definition for overall incidence rate calculation.
+        Function definition to turn per period numerators and denominators into result rows.
+        """
+        numerators = numerators.astype(np.float64)
+        # adding a small constant to avoid division by zero.
+        denominators = denominators.astype(np.float64) + 1e-8
+        point_prev = (numerators / denominators) * self.person_years
+        lower_ci, upper_ci = self.confidence_method.bounds(numerators, denominators)
+        dates = period_start.normalize().strftime(self.dateformat)
+
+        return [
+            (
+                condition_col,
+                dates[i],
+                group,
+                sub_group,
+                float(point_prev[i]),
+                int(numerators[i]),
+                int(denominators[i]),
+                float(lower_ci[i] * self.person_years),
+                float(upper_ci[i] * self.person_years),
+            )
+            for i in range(len(period_start))
+        ]
+
+    def _overall_prevalence_rows(
+        self,
+    ) -> List[Tuple[str, str, str, str, float, int, int, float, float]]:
+        """
+        Function definition for the overall prevalence rows of every condition.
         """
-        overall_df_list = []
         print("Calculating overall prevalence proportions.")
-        for condition_col in tqdm(self.conditions):
-            df_list = []
-            current_period = self.study_start_date
-            while current_period < self.study_end_date:
-                delta = relativedelta(months=self.increment_by_months)
-                year_tuple = self.point_prevalence(self.data, current_period, condition_col)
-                df_list.append(year_tuple)
-                current_period += delta
-            overall_df_list.append(
-                pd.DataFrame(
-                    df_list,
-                    columns=[
-                        "Condition",
-                        "Date",
-                        "Group",
-                        "Subgroup",
-                        "Prevalence",
-                        "Numerator",
-                        "Denominator",
-                        "Lower_CI",
-                        "Upper_CI",
-                    ],
-                )
+        period_start = _period_starts(
+            self.study_start_date, self.study_end_date, self.increment_by_months
+        )
+        patient_start = _to_int64(self.data[self.patient_start_col], _INT64_MAX)
+        patient_end = _to_int64(self.data[self.patient_end_col], _INT64_MIN)
+        # Patients who are in the practice at the start of the interested year, that is they enter the
+        # cohort before the start of the interested year and have not exited before it. This does not
+        # depend on the condition so it is counted once for every period.
+        denominators = _covering_counts(patient_start, patient_end, period_start.asi8)
+
+        def condition_prevalence(
+            condition_col: str,
+        ) -> List[Tuple[str, str, str, str, float, int, int, float, float]]:
+            numerators = _prevalent_counts(
+                patient_start,
+                patient_end,
+                _to_int64(self.data[condition_col], _INT64_MAX),
+                period_start.asi8,
             )
+            return self._prevalence_rows(period_start, numerators, denominators, condition_col)
 
-        if len(overall_df_list) > 0:
-            self.__analysis_overall = pd.concat(overall_df_list)
-        else:
-            self.__analysis_overall = pd.DataFrame()
-        return self.__analysis_overall
+        rows = []
+        for condition_rows in _map_conditions(condition_prevalence, self.conditions, self.n_jobs):
+            rows.extend(condition_rows)
+        return rows
 
-    def calculate_grouped_prevalence(self) -> pd.DataFrame:
+    def _grouped_prevalence_rows(
+        self,
+    ) -> List[Tuple[str, str, str, str, float, int, int, float, float]]:
         """
-        Function definition for subgroup incidence rate calculation.
+        Function definition for the subgroup prevalence rows of every condition.
         """
-        overall_df_list = []
         print("Calculating prevalence proportions by subgroup demography.")
-        for condition_col in tqdm(self.conditions):
-            for demo in self.demography:
-                subgroup_list = []
-                for name, group in self.data.groupby(demo, observed=False):
-                    current_period = self.study_start_date
-                    while current_period < self.study_end_date:
-                        delta = relativedelta(months=self.increment_by_months)
-                        year_tuple = self.point_prevalence(
-                            group, current_period, condition_col, demo, name
+        period_start = _period_starts(
+            self.study_start_date, self.study_end_date, self.increment_by_months
+        )
+        patient_start = _to_int64(self.data[self.patient_start_col], _INT64_MAX)
+        patient_end = _to_int64(self.data[self.patient_end_col], _INT64_MIN)
+
+        # patients are sorted once per demography column, so each subgroup is a slice of the
+        # sorted arrays rather than a boolean selection per subgroup.
+        orderings = []
+        for demo in self.demography:
+            categories = self.data[demo].cat.categories
+            order, bounds = _group_order(self.data[demo].cat.codes.to_numpy(), len(categories))
+            start, end = patient_start[order], patient_end[order]
+            denominators = [
+                _covering_counts(start[lo:hi], end[lo:hi], period_start.asi8)
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+            ]
+            orderings.append((demo, categories, order, bounds, denominators))
+
+        def condition_prevalence(
+            condition_col: str,
+        ) -> List[Tuple[str, str, str, str, float, int, int, float, float]]:
+            condition = _to_int64(self.data[condition_col], _INT64_MAX)
+            subgroup_list = []
+            for demo, categories, order, bounds, denominators in orderings:
+                start, end, onset = patient_start[order], patient_end[order], condition[order]
+                for name, lo, hi, denominator in zip(
+                    categories, bounds[:-1], bounds[1:], denominators
+                ):
+                    numerators = _prevalent_counts(
+                        start[lo:hi], end[lo:hi], onset[lo:hi], period_start.asi8
+                    )
+                    subgroup_list.extend(
+                        self._prevalence_rows(
+                            period_start, numerators, denominator, condition_col, demo, name
                         )
-                        subgroup_list.append(year_tuple)
-                        current_period += delta
-                group_df = pd.DataFrame(
-                    subgroup_list,
-                    columns=[
-                        "Condition",
-                        "Date",
-                        "Group",
-                        "Subgroup",
-                        "Prevalence",
-                        "Numerator",
-                        "Denominator",
-                        "Lower_CI",
-                        "Upper_CI",
-                    ],
-                )
-                overall_df_list.append(group_df)
+                    )
+            return subgroup_list
 
-        if len(overall_df_list) > 0:
-            self.__analysis_subgroup = pd.concat(overall_df_list)
-        else:
-            self.__analysis_subgroup = pd.DataFrame()
+        rows = []
+        for condition_rows in _map_conditions(condition_prevalence, self.conditions, self.n_jobs):
+            rows.extend(condition_rows)
+        return rows
 
-        return self.__analysis_subgroup
+    def calculate_overall_prevalence(self) -> pd.DataFrame:
+        """
+        Function definition for overall incidence rate calculation.
+        """
+        return pd.DataFrame(self._overall_prevalence_rows(), columns=PREVALENCE_COLUMNS)
+
+    def calculate_grouped_prevalence(self) -> pd.DataFrame:
+        """
+        Function definition for subgroup incidence rate calculation.
+        """
+        return pd.DataFrame(self._grouped_prevalence_rows(), columns=PREVALENCE_COLUMNS)
 
     def analyse(self) -> pd.DataFrame:
-        overall_df = self.calculate_overall_prevalence()
-        subgroup_df = self.calculate_grouped_prevalence()
-        return pd.concat([overall_df, subgroup_df])
+        rows = self._overall_prevalence_rows() + self._grouped_prevalence_rows()
+        return pd.DataFrame(rows, columns=PREVALENCE_COLUMNS)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from datetime import datetime
 
@@ -8,8 +8,8 @@ import pandas as pd
 def format_datatypes(
     data: pd.DataFrame,
     condition_cols: List[str],
-    demography_cols: List[str] = None,
-    patient_follow_up_cols: List[str] = None,
+    demography_cols: Optional[List[str]] = None,
+    patient_follow_up_cols: Optional[List[str]] = None,
     date_format: str = "ISO8601",
 ) -> pd.DataFrame:
     """
@@ -17,23 +17,35 @@ def format_datatypes(
     Find columns with Date data and assign it datetime type
     Find columns with categorical data and assign it pd.Category
 
+    Date columns always come out as numpy datetime64[ns], including Arrow-backed timestamp
+    input, so the analysis can work on zero-copy int64 views of them. Columns that already have
+    their target type are left untouched, so formatting the same dataframe again is cheap.
+
     Args:
         data (DataFrame): study data as pandas dataframe.
 
     Returns:
         data (DataFrame): study data as pandas dataframe with formatted columns.
     """
-    if demography_cols is not None:
+    demography_cols = [col for col in demography_cols or [] if data[col].dtype != "category"]
+    if demography_cols:
         data[demography_cols] = data[demography_cols].astype("category")
 
-    data[patient_follow_up_cols] = data[patient_follow_up_cols].apply(
-        pd.to_datetime,
-        format=date_format,
-    )
-    data[condition_cols] = data[condition_cols].apply(
-        pd.to_datetime,
-        format=date_format,
-    )
+    # follow-up and condition dates share a format, so they are parsed together in a single
+    # to_datetime call; cache=True parses each distinct date string only once. Columns that
+    # were already parsed, at load time or by an earlier call, are left as they are.
+    date_cols = [
+        col
+        for col in dict.fromkeys(list(patient_follow_up_cols or []) + list(condition_cols))
+        if data[col].dtype != "datetime64[ns]"
+    ]
+    if date_cols:
+        parsed = pd.to_datetime(
+            data[date_cols].to_numpy().ravel(),
+            format=date_format,
+            cache=True,
+        )
+        data[date_cols] = parsed.to_numpy().reshape(len(data), len(date_cols))
 
     return data
 
@@ -1,12 +1,20 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from functools import lru_cache
 from importlib import resources
 
-import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
+SAMPLE_DATE_COLUMNS = ["START_DATE", "END_DATE", "CONDITION"]
 
-def _load_dataset(filename: str, columns: Optional[List] = None) -> pd.DataFrame:
+
+def _load_dataset(
+    filename: str,
+    columns: Optional[List] = None,
+    date_columns: Optional[List] = None,
+) -> pd.DataFrame:
     """
     Load a dataset from analogy.data
 
@@ -14,13 +22,36 @@ def _load_dataset(filename: str, columns: Optional[List] = None) -> pd.DataFrame
     ----
       filename (string): name of the file to load, for example sample.csv
       columns (list): list of column names to use.
+      date_columns (list): ISO-8601 columns parsed to datetime64[ns] while the file is read.
 
     Returns:
     -------
       Dataframe
     """
-    with resources.path("analogy.data", filename) as df:
-        return pd.read_csv(df, usecols=columns)
+    table = _read_dataset(filename, tuple(date_columns or []))
+    if columns is not None:
+        missing = set(columns).difference(table.column_names)
+        if missing:
+            raise ValueError(f"Usecols do not match columns, columns not found: {sorted(missing)}")
+        table = table.select([col for col in table.column_names if col in columns])
+
+    # to_pandas builds new, writable pandas blocks on every call, so callers can format the
+    # result in place without touching the cached table.
+    return table.to_pandas()
+
+
+@lru_cache(maxsize=4)
+def _read_dataset(filename: str, date_columns: Tuple[str, ...]) -> pa.Table:
+    """
+    Parse a dataset shipped in analogy.data into an immutable Arrow table, streaming it from the
+    package resources.
+    """
+    convert_options = pacsv.ConvertOptions(
+        column_types={col: pa.timestamp("ns") for col in date_columns},
+        timestamp_parsers=[pacsv.ISO8601],
+    )
+    with resources.files("analogy.data").joinpath(filename).open("rb") as file:
+        return pacsv.read_csv(file, convert_options=convert_options)
 
 
 def load_sample_data(columns: Optional[List] = None) -> pd.DataFrame:
@@ -53,6 +84,8 @@ def load_sample_data(columns: Optional[List] = None) -> pd.DataFrame:
       * SEX: demographic variable for patient sex [1 (Male), 2 (Female)].
       * ETHNICITY: demographic variable for patient ethnicity [White, Black, Asian, Mixed, Other, Unknown].
 
+    START_DATE, END_DATE and CONDITION are returned already parsed as datetime64[ns].
+
     Returns:
     -------
     DataFrame
@@ -61,4 +94,4 @@ def load_sample_data(columns: Optional[List] = None) -> pd.DataFrame:
     Examples:
     --------
     """
-    return _load_dataset("sample.csv", columns=columns)
+    return _load_dataset("sample.csv", columns=columns, date_columns=SAMPLE_DATE_COLUMNS)
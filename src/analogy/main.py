@@ -1,17 +1,19 @@
-from typing import List
+from enum import Enum
 
-import numpy as np
-import pandas as pd
 import typer
 
 from analogy import __version__
-from analogy.core.analyser import run_incidence, run_prevalence
-from analogy.utils.file_utils import do_checks, file_loader
-from analogy.utils.formating import format_input
 
 app = typer.Typer()
 
 
+class OutputFormat(str, Enum):
+    """File formats incprev can save its results in."""
+
+    csv = "csv"
+    parquet = "parquet"
+
+
 @app.command()
 def version() -> None:
     """Display the CLI version number."""
@@ -29,6 +31,22 @@ def incprev(
     enddatecol: str,
     personyears: int,
     increment: int,
+    conditions: str = typer.Option(
+        ..., "--conditions", help="Comma separated condition columns to analyse (col1, col2, ...)."
+    ),
+    demography: str = typer.Option(
+        "",
+        "--demography",
+        help="Comma separated demography columns for subgroup analysis, empty if none.",
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.csv, "--output-format", help="Format of the saved results."
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache/--no-cache",
+        help="Read from and write to a parquet copy of every csv column, stored next to the csv.",
+    ),
 ) -> None:
     """
     Run the incidence prevalence analysis.
@@ -50,17 +68,27 @@ def incprev(
     PERSONYEARS: The scale to report results in e.g. per 1000 patients, per 100 patients.  Same for both denominators.
 
     INCREMENT: The number of months between calculations e.g. between each point prevalence calculation, or the length of the period in months for each incidence calculation.
+
+    --conditions: The list of condition columns to calculate incidence and prevalence on, e.g. "CONDITION_1, CONDITION_2".
+
+    --demography: The list of demography columns for subgroup analysis, e.g. "SEX, ETHNICITY". Leave out for no subgroup analysis.
+
+    --output-format: Save the results as csv (default) or as zstd compressed parquet files.
+
+    --cache/--no-cache: Keep a parsed parquet copy of every column of FILEPATH, identifiers included, next to it as FILEPATH.parquet so later runs skip the csv parse, or read the csv every time without writing anything next to it (default).
     """
-    conditions_text = input("Enter the list of conditions columns to analyse (col1, col2, ...): ")
-    demography_text = input(
-        "Enter the list of demography columns for subgroup analyse or leave empty if none (col1, col2, ...): "
-    )
+    # the analysis stack (pandas, numpy, scipy, pyarrow) is only imported when it is needed,
+    # so commands like version start quickly.
+    from analogy.core.analyser import run_incidence_prevalence
+    from analogy.utils.file_utils import do_checks, file_loader
+    from analogy.utils.formating import format_input
+
     do_checks(filepath, result_dest)
     args = format_input(
         startdate=studystart,
         enddate=studyend,
-        conditions=conditions_text,
-        demography=demography_text,
+        conditions=conditions,
+        demography=demography,
         dateformat=dateformat,
         patientstartcol=startdatecol,
         patientendcol=enddatecol,
@@ -68,20 +96,29 @@ def incprev(
         increment=increment,
     )
 
-    usecols = (
-        [args["patient_start_col"], args["patient_end_col"]]
-        + args["conditions"]
-        + args["demography"]
+    # dict.fromkeys keeps the column order and drops repeats, e.g. a condition column that is
+    # also the follow-up start, so every column is parsed once.
+    date_cols = list(
+        dict.fromkeys([args["patient_start_col"], args["patient_end_col"], *args["conditions"]])
     )
-    df = file_loader(filepath, usecols)
-    run_incidence(df, args, result_dest)
-    run_prevalence(df, args, result_dest)
+    usecols = list(dict.fromkeys([*date_cols, *args["demography"]]))
+    df = file_loader(
+        filepath,
+        usecols,
+        date_cols=date_cols,
+        date_format=args["date_format"],
+        category_cols=args["demography"],
+        cache=cache,
+    )
+    run_incidence_prevalence(df, args, result_dest, file_format=output_format.value)
 
 
 def set_seed() -> None:
     """Function to initialise random generator with intial seed
     application wide for reproducible research.
     """
+    import numpy as np
+
     np.random.seed(42)
 
 
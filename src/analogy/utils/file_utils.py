@@ -1,8 +1,41 @@
-from typing import List
+from typing import List, Optional
 
+import csv
+import json
 import os
+import stat
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# date formats that Arrow's own ISO-8601 timestamp parser reads the same way as pandas.
+_ISO_DATE_FORMATS = {"ISO8601", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f"}
+# version of the table file_loader produces; bump it whenever a loader change alters the parsed
+# values, so caches written by earlier versions are rebuilt instead of served.
+_CACHE_VERSION = b"analogy.cache_version"
+_CACHE_FORMAT_VERSION = b"1"
+# parquet schema metadata recording how the date columns of a cached csv were parsed.
+_CACHE_DATE_COLS = b"analogy.date_cols"
+_CACHE_DATE_FORMAT = b"analogy.date_format"
+# size and modification time of the csv the cache was built from.
+_CACHE_SOURCE_SIZE = b"analogy.source_size"
+_CACHE_SOURCE_MTIME = b"analogy.source_mtime_ns"
+
+
+def _path_mode(path: Optional[str]) -> Optional[int]:
+    """
+    Read the file mode of a path with a single stat call, or None if the path can't be read.
+    """
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
 
 
 def check_is_file(filepath: str) -> bool:
@@ -16,12 +49,8 @@ def check_is_file(filepath: str) -> bool:
     Return:
       flag (bool): True if file exists else False.
     """
-    flag: bool = False
-
-    if filepath is not None and os.path.isfile(filepath):
-        flag = True
-
-    return flag
+    mode = _path_mode(filepath)
+    return mode is not None and stat.S_ISREG(mode)
 
 
 def check_file_extension(filepath: str) -> bool:
@@ -36,12 +65,7 @@ def check_file_extension(filepath: str) -> bool:
     ------
       flag (bool): True if file exists else False.
     """
-    flag: bool = False
-
-    if filepath is not None and filepath.endswith(".csv"):
-        flag = True
-
-    return flag
+    return filepath is not None and filepath.endswith(".csv")
 
 
 def check_is_directory(dirpath: str) -> bool:
@@ -56,12 +80,8 @@ def check_is_directory(dirpath: str) -> bool:
     ------
       flag (bool): True if directroy exists else False.
     """
-    flag: bool = False
-
-    if dirpath is not None and os.path.isdir(dirpath):
-        flag = True
-
-    return flag
+    mode = _path_mode(dirpath)
+    return mode is not None and stat.S_ISDIR(mode)
 
 
 def do_checks(filepath: str, destination_path: str) -> None:
@@ -92,22 +112,201 @@ def do_checks(filepath: str, destination_path: str) -> None:
     assert status == True, "The result destination folder doesn't exist. \n"
 
 
-def file_loader(filepath: str, usecols: List[str] = None) -> pd.DataFrame:
+def file_loader(
+    filepath: str,
+    usecols: Optional[List[str]] = None,
+    date_cols: Optional[List[str]] = None,
+    date_format: str = "ISO8601",
+    category_cols: Optional[List[str]] = None,
+    cache: bool = False,
+) -> pd.DataFrame:
     """
     Read file from user defined path and load to memory.
 
+    The csv is parsed by pyarrow with multi-threaded tokenisation, and only the requested columns
+    are converted. Date columns are parsed to datetime64[ns] during the read when Arrow can parse
+    date_format; otherwise they are left as text for format_datatypes.
+
+    With cache enabled every column of the parsed csv, including ones not in usecols, is also
+    written next to it as <filepath>.parquet, and later loads read only the requested columns from
+    that file while the csv keeps the size and modification time it had when the cache was built
+    and the loader version and date settings are the same.
+
     Args:
     ----
       filepath (string): path for the datafile as string.
+      usecols (list): list of column names to load. Default: all columns.
+      date_cols (list): date columns to parse while reading.
+      date_format (str): format of the date columns. Default: 'ISO8601'.
+      category_cols (list): columns to load as pandas categories, e.g. demography columns.
+      cache (bool): read from and write to the parquet cache. Default: False
 
     Returns:
     -------
       DataFrame
+
+    Raises:
+    ------
+      ValueError: usecols or date_cols name a column that is not in the csv header.
+    """
+    date_cols = list(date_cols or [])
+    # checked against the header up front, so a mistyped column fails before the csv is parsed.
+    missing = set([*(usecols or []), *date_cols]).difference(_read_header(filepath))
+    if missing:
+        raise ValueError(f"Usecols do not match columns, columns not found: {sorted(missing)}")
+
+    if not cache:
+        table = _read_csv_table(filepath, usecols, date_cols, date_format)
+        return _to_pandas(table, category_cols)
+
+    cache_path = filepath + ".parquet"
+    # taken before the read, so a csv changed while it is parsed leaves a cache that is rebuilt.
+    source = os.stat(filepath)
+    if _is_cache_valid(cache_path, source, date_cols, date_format):
+        table = pq.read_table(cache_path, columns=usecols)
+        return _to_pandas(table, category_cols)
+
+    table = _read_csv_table(filepath, None, date_cols, date_format)
+    metadata = {
+        _CACHE_VERSION: _CACHE_FORMAT_VERSION,
+        _CACHE_DATE_COLS: json.dumps(date_cols).encode(),
+        _CACHE_DATE_FORMAT: date_format.encode(),
+        _CACHE_SOURCE_SIZE: str(source.st_size).encode(),
+        _CACHE_SOURCE_MTIME: str(source.st_mtime_ns).encode(),
+    }
+    try:
+        # written to a temporary file first so a failed write never leaves a partial cache.
+        pq.write_table(
+            table.replace_schema_metadata(metadata),
+            cache_path + ".tmp",
+            compression="snappy",
+            use_dictionary=True,
+        )
+        os.replace(cache_path + ".tmp", cache_path)
+    except OSError:
+        # a read-only data directory only means there is no cache.
+        pass
+
+    if usecols is not None:
+        table = table.select(usecols)
+    return _to_pandas(table, category_cols)
+
+
+def _read_header(filepath: str) -> List[str]:
+    """
+    Read the column names from the first row of a csv.
     """
-    return pd.read_csv(filepath, usecols=usecols, low_memory=False)
+    with open(filepath, newline="", encoding="utf-8-sig") as source:
+        return next(csv.reader(source), [])
 
 
-def save_dataframe(data: pd.DataFrame, filepath: str, filename: str, index: bool = False) -> None:
+def _to_pandas(table: pa.Table, category_cols: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Convert an Arrow table to pandas without keeping the Arrow copy, dictionary encoding the
+    category columns so pandas receives them as int codes plus a small categories table.
+    """
+    category_cols = [col for col in category_cols or [] if col in table.column_names]
+    for col in category_cols:
+        index = table.schema.get_field_index(col)
+        table = table.set_column(index, col, pc.dictionary_encode(table.column(col)))
+
+    # missing text comes out of Arrow as None, pd.read_csv gives NaN.
+    text_cols = [
+        field.name
+        for field in table.schema
+        if pa.types.is_string(field.type) and table.column(field.name).null_count
+    ]
+
+    data = table.to_pandas(split_blocks=True, self_destruct=True)
+    for col in text_cols:
+        data[col] = data[col].where(data[col].notna(), np.nan)
+    # Arrow keeps categories in order of appearance; sort them as astype("category") would.
+    for col in category_cols:
+        data[col] = data[col].cat.reorder_categories(data[col].cat.categories.sort_values())
+    return data
+
+
+def _is_cache_valid(
+    cache_path: str, source: os.stat_result, date_cols: List[str], date_format: str
+) -> bool:
+    """
+    Check if the parquet cache was written by the current loader version from a csv with exactly
+    the current size and modification time, and has the requested date columns parsed with the
+    same date format.
+    An mtime ordering check is not enough: cp -p or rsync -t can give new content an older mtime.
+    """
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+
+    if metadata.get(_CACHE_VERSION) != _CACHE_FORMAT_VERSION:
+        return False
+    if metadata.get(_CACHE_SOURCE_SIZE) != str(source.st_size).encode():
+        return False
+    if metadata.get(_CACHE_SOURCE_MTIME) != str(source.st_mtime_ns).encode():
+        return False
+    cached_cols = json.loads(metadata.get(_CACHE_DATE_COLS, b"[]"))
+    return metadata.get(_CACHE_DATE_FORMAT) == date_format.encode() and set(date_cols) <= set(
+        cached_cols
+    )
+
+
+def _read_csv_table(
+    filepath: str, usecols: Optional[List[str]], date_cols: List[str], date_format: str
+) -> pa.Table:
+    """
+    Parse a csv into an Arrow table, typing the date columns as timestamp[ns] when Arrow can
+    parse date_format and as text otherwise.
+    """
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+
+    if date_format in _ISO_DATE_FORMATS:
+        timestamp_parsers = [pacsv.ISO8601]
+    elif "%f" not in date_format:
+        timestamp_parsers = [date_format]
+    else:
+        timestamp_parsers = None
+
+    # the csv is memory mapped so the reader's blocks are views of the page cache rather than
+    # copies through a buffered file.
+    with pa.memory_map(filepath, "r") as source:
+        if date_cols and timestamp_parsers is not None:
+            try:
+                return pacsv.read_csv(
+                    source,
+                    read_options=read_options,
+                    convert_options=pacsv.ConvertOptions(
+                        include_columns=usecols,
+                        column_types={col: pa.timestamp("ns") for col in date_cols},
+                        timestamp_parsers=timestamp_parsers,
+                        strings_can_be_null=True,
+                    ),
+                )
+            except pa.ArrowInvalid:
+                # dates Arrow can't read are left to the pandas parser and its error messages.
+                source.seek(0)
+
+        # date columns are kept as text here so Arrow's ISO-8601 type inference can't read them
+        # in a different way from date_format.
+        return pacsv.read_csv(
+            source,
+            read_options=read_options,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=usecols,
+                column_types={col: pa.string() for col in date_cols},
+                strings_can_be_null=True,
+            ),
+        )
+
+
+def save_dataframe(
+    data: pd.DataFrame,
+    filepath: str,
+    filename: str,
+    index: bool = False,
+    file_format: str = "csv",
+) -> None:
     """
     Write pandas dataframe to disk.
 
@@ -116,10 +315,25 @@ def save_dataframe(data: pd.DataFrame, filepath: str, filename: str, index: bool
       filepath (string): path for the datafile as string.
       filename (string): name of the file to store in the disk.
       index (bool): save the index of the dataframe. Default: False
+      file_format (string): 'csv' or 'parquet'. Parquet output is zstd compressed and replaces
+        the extension of filename with .parquet. Default: 'csv'
 
     Returns:
     -------
       None
+
+    Raises:
+    ------
+      ValueError
     """
     filename = os.path.join(filepath, filename)
-    data.to_csv(filename, index=index)
+    if file_format == "csv":
+        data.to_csv(filename, index=index)
+    elif file_format == "parquet":
+        filename = os.path.splitext(filename)[0] + ".parquet"
+        # object columns can mix types, e.g. numeric and text subgroups, which a parquet column
+        # can't hold; they are written as text, as they appear in the csv.
+        data = data.astype({col: "string" for col in data.columns[data.dtypes == object]})
+        data.to_parquet(filename, engine="pyarrow", compression="zstd", index=index)
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}, expected 'csv' or 'parquet'.")
@@ -1,6 +1,6 @@
-from typing import List, TypedDict
+from typing import List, Tuple, TypedDict
 
-from collections import namedtuple
+from functools import lru_cache
 
 Arguments = TypedDict(
     "Arguments",
@@ -30,7 +30,7 @@ def format_input(
     increment: int,
 ) -> Arguments:
     """
-    Function format user input and store it in a named tuple.
+    Function format user input and store it in a dictionary.
 
     Args:
       startdate (str):
@@ -46,26 +46,8 @@ def format_input(
     Returns:
       Arguments (dict)
     """
-    Arguments = namedtuple(
-        "Arguments",
-        [
-            "study_start_date",
-            "study_end_date",
-            "condition_columns",
-            "demography_columns",
-            "followup_start_col",
-            "followup_end_col",
-            "personyears",
-            "dateformat",
-            "increment",
-        ],
-    )
-    condition_list = conditions.replace(" ", "").split(",")
-
-    if not (demography and demography.strip()):
-        demography_list = []
-    else:
-        demography_list = demography.replace(" ", "").split(",")
+    condition_list = list(_split_columns(conditions))
+    demography_list = list(_split_columns(demography or ""))
 
     return {
         "study_start_date": startdate,
@@ -78,3 +60,12 @@ def format_input(
         "date_format": dateformat,
         "increment_by_months": int(increment),
     }
+
+
+@lru_cache(maxsize=32)
+def _split_columns(text: str) -> Tuple[str, ...]:
+    """
+    Function to split a comma separated list of column names into stripped, non-empty names.
+    Results are cached and returned as tuples so repeated calls can share them safely.
+    """
+    return tuple(token for token in (column.strip() for column in text.split(",")) if token)
@@ -1,4 +1,7 @@
+import numpy as np
 import pytest
+from scipy.special import chdtri
+from scipy.stats import chi2, norm
 
 from src.analogy.core.confidence_interval import (
     ByarsConfidenceInterval,
@@ -24,3 +27,100 @@ def test_chi_confidence_interval():
 
     assert round(lower, 4) == 50.1656
     assert round(upper, 4) == 82.8478
+
+
+def _reference_bounds(numerators, denominators, alpha=0.05):
+    # textbook formulas evaluated with scipy.stats, independent of the interval classes.
+    z = norm.ppf(1 - alpha / 2)
+    lower, upper = [], []
+    for n, d in zip(numerators, denominators):
+        if n < 10:
+            lower.append(chi2.ppf(alpha / 2, 2 * n) / 2 / d)
+            upper.append(chi2.ppf(1 - alpha / 2, 2 * n + 2) / 2 / d)
+        else:
+            lower.append(n * (1 - 1 / (9 * n) - z / (3 * np.sqrt(n))) ** 3 / d)
+            upper.append((n + 1) * (1 - 1 / (9 * (n + 1)) + z / (3 * np.sqrt(n + 1))) ** 3 / d)
+    return np.array(lower), np.array(upper)
+
+
+def test_byars_bounds_match_reference():
+    ci = ByarsConfidenceInterval()
+    numerators = np.arange(1, 40, dtype=np.float64)
+    denominators = np.linspace(10.0, 500.0, len(numerators))
+
+    lower, upper = ci.bounds(numerators, denominators)
+    expected_lower, expected_upper = _reference_bounds(numerators, denominators)
+
+    assert np.allclose(lower, expected_lower, rtol=1e-12)
+    assert np.allclose(upper, expected_upper, rtol=1e-12)
+
+
+def test_byars_and_chi_squared_bounds_agree_below_ten_for_2d_input():
+    numerators = np.array([[0.0, 1.0, 3.0], [5.0, 7.0, 9.0]])
+    denominators = np.array([[50.0, 80.0, 120.0], [200.0, 350.0, 500.0]])
+
+    byars = ByarsConfidenceInterval().bounds(numerators, denominators)
+    chi_squared = ChiSquaredConfidenceInterval().bounds(numerators, denominators)
+    expected = _reference_bounds(numerators.ravel(), denominators.ravel())
+
+    for byars_bound, chi_bound, expected_bound in zip(byars, chi_squared, expected):
+        assert byars_bound.shape == numerators.shape
+        assert np.allclose(byars_bound, chi_bound, rtol=1e-12, equal_nan=True)
+        assert np.allclose(byars_bound.ravel(), expected_bound, rtol=1e-12, equal_nan=True)
+
+
+def test_chdtri_matches_chi2_ppf():
+    dof = np.arange(1, 200, dtype=np.float64)
+    for q in (0.025, 0.975):
+        assert np.allclose(chdtri(dof, 1 - q), chi2.ppf(q, dof), rtol=1e-12, atol=0)
+
+
+def test_chi_squared_batch_matches_chi2_percentiles():
+    ci = ChiSquaredConfidenceInterval()
+    numerators = np.arange(1, 30, dtype=np.float64)
+    denominators = np.full(len(numerators), 250.0)
+
+    lower = ci.lower_bound_batch(numerators, denominators)
+    upper = ci.upper_bound_batch(numerators, denominators)
+
+    assert np.allclose(lower, chi2.ppf(0.025, 2 * numerators) / 2 / denominators, rtol=1e-12)
+    assert np.allclose(upper, chi2.ppf(0.975, 2 * numerators + 2) / 2 / denominators, rtol=1e-12)
+
+
+def test_byars_batch_uses_exact_method_below_ten():
+    ci = ByarsConfidenceInterval()
+    exact = ChiSquaredConfidenceInterval()
+    numerators = np.array([[3.0, 9.0], [10.0, 65.0]])
+    denominators = np.full(numerators.shape, 100.0)
+
+    lower = ci.lower_bound_batch(numerators, denominators)
+    upper = ci.upper_bound_batch(numerators, denominators)
+
+    assert lower.shape == upper.shape == numerators.shape
+    assert np.allclose(lower[0], exact.lower_bound_batch(numerators[0], denominators[0]))
+    assert np.allclose(upper[0], exact.upper_bound_batch(numerators[0], denominators[0]))
+    assert round(lower[1, 1] * 100, 4) == 50.1632
+    assert round(upper[1, 1] * 100, 4) == 82.8491
+
+
+@pytest.mark.parametrize("interval", [ByarsConfidenceInterval, ChiSquaredConfidenceInterval])
+def test_bounds_scalar_input(interval):
+    ci = interval()
+
+    lower, upper = ci.bounds(5, 100)
+
+    assert np.shape(lower) == np.shape(upper) == ()
+    assert lower == pytest.approx(chi2.ppf(0.025, 10) / 2 / 100, rel=1e-12)
+    assert upper == pytest.approx(chi2.ppf(0.975, 12) / 2 / 100, rel=1e-12)
+
+
+@pytest.mark.parametrize("interval", [ByarsConfidenceInterval, ChiSquaredConfidenceInterval])
+def test_bounds_two_dimensional_input(interval):
+    ci = interval()
+    numerators = np.array([[5.0, 7.0], [1.0, 2.0]])
+
+    lower, upper = ci.bounds(numerators, 100.0)
+
+    assert lower.shape == upper.shape == numerators.shape
+    assert np.allclose(lower, chi2.ppf(0.025, 2 * numerators) / 2 / 100, rtol=1e-12)
+    assert np.allclose(upper, chi2.ppf(0.975, 2 * numerators + 2) / 2 / 100, rtol=1e-12)
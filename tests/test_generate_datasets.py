@@ -7,3 +7,17 @@ def test_sample_dataset():
     dataset = load_sample_data()
 
     assert dataset.shape[0] == 2438
+
+
+def test_sample_dataset_dates_parsed_at_load():
+    dataset = load_sample_data(columns=["PATIENT_ID", "START_DATE", "END_DATE"])
+
+    assert list(dataset.columns) == ["PATIENT_ID", "START_DATE", "END_DATE"]
+    assert (dataset.dtypes[["START_DATE", "END_DATE"]] == "datetime64[ns]").all()
+
+
+def test_sample_dataset_returns_independent_copies():
+    first = load_sample_data()
+    first["SEX"] = 0
+
+    assert set(load_sample_data()["SEX"]) == {1, 2}
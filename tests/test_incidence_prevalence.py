@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analogy.core import incidence_prevalence
+from src.analogy.core.analyser import preprocess, run_incidence_prevalence
+from src.analogy.core.confidence_interval import ByarsConfidenceInterval
+from src.analogy.core.incidence_prevalence import Incidence, Prevalence
+
+
+def study_data():
+    return pd.DataFrame(
+        {
+            "START_DATE": ["2019-06-01", "2020-04-01", "2021-03-01", "2019-01-01", "2020-01-01"],
+            "END_DATE": ["2022-06-01", "2021-04-01", "2023-01-01", "2019-12-31", "2022-01-01"],
+            "CONDITION": ["2020-07-01", None, "2021-12-01", None, "2019-05-01"],
+            "SEX": [1, 2, 1, 2, 1],
+        }
+    )
+
+
+def study_args():
+    return dict(
+        study_start_date="2020-01-01",
+        study_end_date="2021-12-31",
+        patient_start_col="START_DATE",
+        patient_end_col="END_DATE",
+        conditions=["CONDITION"],
+        date_format="%Y-%m-%d",
+    )
+
+
+def test_overall_incidence():
+    incidence = Incidence(study_data(), **study_args())
+    result = incidence.calculate_overall_incidence()
+
+    assert list(result["Date"]) == ["2020-01-01", "2021-01-01"]
+    assert list(result["Numerator"]) == [1, 1]
+    assert np.allclose(result["Denominator"], [(182 + 275) / 366, (90 + 275) / 365])
+    assert np.allclose(result["Incidence"], result["Numerator"] / result["Denominator"])
+
+
+def test_overall_incidence_with_time_of_day():
+    data = study_data()
+    for col in ["START_DATE", "END_DATE", "CONDITION"]:
+        data[col] = data[col].where(data[col].isna(), data[col] + " 12:00:00")
+    args = {
+        **study_args(),
+        "study_start_date": "2020-01-01 00:00:00",
+        "study_end_date": "2021-12-31 00:00:00",
+        "date_format": "%Y-%m-%d %H:%M:%S",
+    }
+
+    result = Incidence(data, **args).calculate_overall_incidence()
+
+    # whole days of follow-up are counted, so the second patient's 274.5 days in 2020 count as 274.
+    assert list(result["Numerator"]) == [1, 1]
+    assert np.allclose(result["Denominator"], [(182 + 274) / 366, (90 + 275) / 365])
+
+
+def test_overall_incidence_in_small_blocks(monkeypatch):
+    # one period per block, with nobody at risk in January, April and June.
+    monkeypatch.setattr(incidence_prevalence, "_MAX_BLOCK_CELLS", 1)
+    data = pd.DataFrame(
+        {
+            "START_DATE": ["2020-02-10", "2020-05-01"],
+            "END_DATE": ["2020-12-31", "2020-05-21"],
+            "CONDITION": ["2020-03-15", None],
+        }
+    )
+    args = {**study_args(), "study_end_date": "2020-06-30", "increment_by_months": 1}
+
+    result = Incidence(data, **args).calculate_overall_incidence()
+
+    assert list(result["Numerator"]) == [0, 0, 1, 0, 0, 0]
+    assert np.allclose(result["Denominator"], [1e-8, 20 / 29, 14 / 31, 1e-8, 20 / 31, 1e-8])
+
+
+def test_period_incidence_matches_overall():
+    incidence = Incidence(study_data(), **study_args())
+    overall = incidence.calculate_overall_incidence()
+
+    periods = zip(*incidence.study_periods())
+    for row, (start, end) in zip(overall.itertuples(index=False), periods):
+        single = incidence.period_incidence(incidence.data, start, end, "CONDITION")
+        assert single[5] == row.Numerator
+        assert single[6] == pytest.approx(row.Denominator)
+
+
+def test_grouped_incidence():
+    incidence = Incidence(study_data(), demography=["SEX"], **study_args())
+    result = incidence.calculate_grouped_incidence()
+
+    assert list(result["Subgroup"]) == [1, 1, 2, 2]
+    assert list(result["Numerator"]) == [1, 1, 0, 0]
+    assert np.allclose(result["Denominator"], [182 / 366, 275 / 365, 275 / 366, 90 / 365])
+
+
+def test_incidence_uses_alpha():
+    incidence = Incidence(study_data(), alpha=0.1, **study_args())
+    result = incidence.calculate_overall_incidence()
+
+    lower, upper = ByarsConfidenceInterval(alpha=0.1).bounds(
+        result["Numerator"].to_numpy(), result["Denominator"].to_numpy()
+    )
+    default = Incidence(study_data(), **study_args()).calculate_overall_incidence()
+
+    assert np.allclose(result["Lower_CI"], lower)
+    assert np.allclose(result["Upper_CI"], upper)
+    assert not np.allclose(result["Upper_CI"], default["Upper_CI"])
+
+
+def test_overall_prevalence():
+    prevalence = Prevalence(study_data(), **study_args())
+    result = prevalence.calculate_overall_prevalence()
+
+    assert list(result["Date"]) == ["2020-01-01", "2021-01-01"]
+    assert list(result["Numerator"]) == [1, 2]
+    assert list(result["Denominator"]) == [2, 3]
+    assert np.allclose(result["Prevalence"], [1 / 2, 2 / 3])
+
+
+@pytest.mark.parametrize("analysis", [Incidence, Prevalence])
+def test_threaded_conditions_match_sequential(analysis):
+    data = study_data()
+    data["CONDITION_2"] = data["START_DATE"]
+    args = {**study_args(), "conditions": ["CONDITION", "CONDITION_2"], "demography": ["SEX"]}
+
+    sequential = analysis(data.copy(), **args).analyse()
+    threaded = analysis(data.copy(), n_jobs=2, **args).analyse()
+
+    pd.testing.assert_frame_equal(sequential, threaded)
+
+
+@pytest.mark.parametrize("analysis", [Incidence, Prevalence])
+@pytest.mark.parametrize("n_jobs", [0, -2])
+def test_invalid_n_jobs(analysis, n_jobs):
+    with pytest.raises(ValueError, match="n_jobs"):
+        analysis(study_data(), n_jobs=n_jobs, **study_args())
+
+
+@pytest.mark.parametrize("analysis", [Incidence, Prevalence])
+def test_default_lists_are_not_shared(analysis):
+    args = study_args()
+    del args["conditions"]
+    first = analysis(study_data(), **args)
+    first.conditions.append("CONDITION")
+
+    assert analysis(study_data(), **args).conditions == []
+
+
+@pytest.mark.parametrize("analysis", [Incidence, Prevalence])
+def test_preprocessed_data_matches_raw(analysis):
+    args = {**study_args(), "demography": ["SEX"]}
+    data = preprocess(study_data(), args)
+
+    assert (data.dtypes[["START_DATE", "END_DATE", "CONDITION"]] == "datetime64[ns]").all()
+    assert data["SEX"].dtype == "category"
+    pd.testing.assert_frame_equal(
+        analysis(data, **args).analyse(), analysis(study_data(), **args).analyse()
+    )
+
+
+def test_run_incidence_prevalence_writes_both_analyses(tmp_path):
+    args = {**study_args(), "demography": ["SEX"]}
+    run_incidence_prevalence(study_data(), args, str(tmp_path))
+
+    for name, analysis in [("incidence", Incidence), ("prevalence", Prevalence)]:
+        saved = pd.read_csv(tmp_path / f"{name}_analysis.csv")
+        expected = analysis(study_data(), **args).analyse()
+        assert list(saved.columns) == list(expected.columns)
+        assert np.allclose(saved["Numerator"], expected["Numerator"])
+        assert np.allclose(saved["Denominator"], expected["Denominator"])
@@ -0,0 +1,77 @@
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from src.analogy.core.incidence_prevalence import Incidence, Prevalence
+from src.analogy.main import app
+from src.analogy.utils.formating import format_input
+
+runner = CliRunner()
+
+SAMPLE = "src/analogy/data/sample.csv"
+STUDY = [
+    "2001-01-01 00:00:00.0",
+    "2020-12-31 00:00:00.0",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "START_DATE",
+    "END_DATE",
+    "1000",
+    "12",
+]
+
+
+def test_incprev(tmp_path):
+    filepath = str(tmp_path / "sample.csv")
+    shutil.copy(SAMPLE, filepath)
+
+    result = runner.invoke(
+        app,
+        ["incprev", filepath, str(tmp_path), *STUDY]
+        + ["--conditions", "CONDITION", "--demography", "SEX, ETHNICITY"],
+    )
+    assert result.exit_code == 0, result.output
+    assert not (tmp_path / "sample.csv.parquet").exists()
+
+    args = format_input(
+        startdate=STUDY[0],
+        enddate=STUDY[1],
+        conditions="CONDITION",
+        demography="SEX, ETHNICITY",
+        dateformat=STUDY[2],
+        patientstartcol=STUDY[3],
+        patientendcol=STUDY[4],
+        personyears=int(STUDY[5]),
+        increment=int(STUDY[6]),
+    )
+    for name, analysis in [("incidence", Incidence), ("prevalence", Prevalence)]:
+        saved = pd.read_csv(tmp_path / f"{name}_analysis.csv")
+        expected = analysis(pd.read_csv(SAMPLE), **args).analyse()
+        assert len(saved) == len(expected)
+        assert np.allclose(saved["Numerator"], expected["Numerator"])
+        assert np.allclose(saved["Denominator"], expected["Denominator"])
+
+
+def test_version():
+    result = runner.invoke(app, ["version"])
+
+    assert result.exit_code == 0, result.output
+    assert "Analogy version" in result.output
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_incprev_cache(tmp_path, cache):
+    filepath = str(tmp_path / "sample.csv")
+    shutil.copy(SAMPLE, filepath)
+
+    result = runner.invoke(
+        app,
+        ["incprev", filepath, str(tmp_path), *STUDY, "--conditions", "CONDITION"]
+        + ["--cache" if cache else "--no-cache"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "incidence_analysis.csv").is_file()
+    assert (tmp_path / "sample.csv.parquet").exists() == cache
@@ -1,8 +1,19 @@
 import os
+import shutil
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
-from src.analogy.utils.file_utils import check_file_extension, check_is_directory, check_is_file
+from src.analogy.utils.file_utils import (
+    check_file_extension,
+    check_is_directory,
+    check_is_file,
+    file_loader,
+    save_dataframe,
+)
+from src.analogy.utils.formating import format_input
 
 
 @pytest.mark.parametrize(
@@ -23,3 +34,171 @@ def test_file_utilities(resource_path, file_expected, directory_expected):
     assert status_ext == file_expected
     assert status_file == file_expected
     assert status_dir == directory_expected
+
+
+@pytest.mark.parametrize(
+    ("date_format", "date_dtype"),
+    [("%Y-%m-%d %H:%M:%S.%f", "datetime64[ns]"), ("%d/%m/%Y", "object")],
+)
+def test_file_loader_dates(date_format, date_dtype):
+    data = file_loader(
+        "src/analogy/data/sample.csv",
+        usecols=["START_DATE", "END_DATE", "SEX"],
+        date_cols=["START_DATE", "END_DATE"],
+        date_format=date_format,
+        cache=False,
+    )
+
+    assert list(data.columns) == ["START_DATE", "END_DATE", "SEX"]
+    assert data.shape[0] == 2438
+    assert (data.dtypes[["START_DATE", "END_DATE"]] == date_dtype).all()
+
+
+def test_file_loader_parquet_cache(tmp_path):
+    filepath = str(tmp_path / "sample.csv")
+    shutil.copy("src/analogy/data/sample.csv", filepath)
+    args = dict(
+        date_cols=["START_DATE", "END_DATE"], date_format="%Y-%m-%d %H:%M:%S.%f", cache=True
+    )
+
+    parsed = file_loader(filepath, usecols=["START_DATE", "END_DATE", "SEX"], **args)
+    assert os.path.isfile(filepath + ".parquet")
+
+    cached = file_loader(filepath, usecols=["START_DATE", "END_DATE", "SEX"], **args)
+    pd.testing.assert_frame_equal(parsed, cached)
+
+    uncached = file_loader(
+        filepath, usecols=["ETHNICITY", "START_DATE"], **{**args, "cache": False}
+    )
+    pd.testing.assert_frame_equal(
+        file_loader(filepath, usecols=["ETHNICITY", "START_DATE"], **args), uncached
+    )
+
+
+def test_file_loader_parquet_cache_replaced_with_older_csv(tmp_path):
+    filepath = str(tmp_path / "sample.csv")
+    shutil.copy("src/analogy/data/sample.csv", filepath)
+    args = dict(usecols=["SEX"], date_cols=["START_DATE", "END_DATE"], cache=True)
+
+    assert file_loader(filepath, **args).shape[0] == 2438
+
+    # new content with an mtime older than the cache, as cp -p or rsync -t would leave it.
+    with open("src/analogy/data/sample.csv") as source, open(filepath, "w") as target:
+        target.writelines(source.readlines()[:101])
+    cache_mtime = os.stat(filepath + ".parquet").st_mtime_ns
+    os.utime(filepath, ns=(cache_mtime - 10**9, cache_mtime - 10**9))
+
+    assert file_loader(filepath, **args).shape[0] == 100
+
+
+def test_file_loader_parquet_cache_from_older_loader(tmp_path):
+    filepath = str(tmp_path / "sample.csv")
+    shutil.copy("src/analogy/data/sample.csv", filepath)
+    args = dict(usecols=["SEX"], date_cols=["START_DATE", "END_DATE"])
+    file_loader(filepath, cache=True, **args)
+
+    # a cache written before the version key existed, holding values the loader no longer makes.
+    table = pq.read_table(filepath + ".parquet")
+    metadata = dict(table.schema.metadata)
+    del metadata[b"analogy.cache_version"]
+    stale = table.set_column(
+        table.schema.get_field_index("SEX"), "SEX", pa.array([0] * table.num_rows)
+    )
+    pq.write_table(stale.replace_schema_metadata(metadata), filepath + ".parquet")
+
+    pd.testing.assert_frame_equal(
+        file_loader(filepath, cache=True, **args), file_loader(filepath, **args)
+    )
+    assert pq.read_schema(filepath + ".parquet").metadata[b"analogy.cache_version"] == b"1"
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_file_loader_unknown_column(tmp_path, cache):
+    filepath = str(tmp_path / "sample.csv")
+    shutil.copy("src/analogy/data/sample.csv", filepath)
+
+    with pytest.raises(ValueError, match=r"columns not found: \['CONDITON'\]"):
+        file_loader(
+            filepath,
+            usecols=["START_DATE", "CONDITON"],
+            date_cols=["START_DATE", "CONDITON"],
+            cache=cache,
+        )
+    assert not os.path.exists(filepath + ".parquet")
+
+
+def test_file_loader_categories():
+    data = file_loader(
+        "src/analogy/data/sample.csv",
+        usecols=["SEX", "ETHNICITY"],
+        category_cols=["SEX", "ETHNICITY"],
+        cache=False,
+    )
+    expected = pd.read_csv("src/analogy/data/sample.csv", usecols=["SEX", "ETHNICITY"])
+
+    pd.testing.assert_frame_equal(data, expected.astype("category"))
+
+
+@pytest.mark.parametrize(
+    ("conditions", "demography", "condition_list", "demography_list"),
+    [
+        ("CONDITION", "", ["CONDITION"], []),
+        ("COND_A, COND_B,", " SEX ,ETHNICITY", ["COND_A", "COND_B"], ["SEX", "ETHNICITY"]),
+        ("first condition, second", "   ", ["first condition", "second"], []),
+    ],
+)
+def test_format_input_columns(conditions, demography, condition_list, demography_list):
+    args = format_input(
+        startdate="2020-01-01",
+        enddate="2021-12-31",
+        conditions=conditions,
+        demography=demography,
+        dateformat="%Y-%m-%d",
+        patientstartcol="START_DATE",
+        patientendcol="END_DATE",
+        personyears="1000",
+        increment="12",
+    )
+
+    assert args["conditions"] == condition_list
+    assert args["demography"] == demography_list
+    assert args["person_years"] == 1000
+
+
+@pytest.mark.parametrize(
+    ("file_format", "filename", "reader"),
+    [("csv", "result.csv", pd.read_csv), ("parquet", "result.parquet", pd.read_parquet)],
+)
+def test_save_dataframe_formats(tmp_path, file_format, filename, reader):
+    data = pd.DataFrame({"Subgroup": ["", 1, "White"], "Numerator": [3, 1, 2]})
+    save_dataframe(data, str(tmp_path), "result.csv", file_format=file_format)
+
+    saved = reader(tmp_path / filename)
+    assert list(saved["Numerator"]) == [3, 1, 2]
+
+
+def test_save_dataframe_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        save_dataframe(pd.DataFrame({"a": [1]}), str(tmp_path), "result.csv", file_format="xlsx")
+
+
+@pytest.mark.parametrize("date_format", ["%Y-%m-%d %H:%M:%S.%f", "%d/%m/%Y"])
+def test_file_loader_missing_text_matches_read_csv(tmp_path, date_format):
+    data = pd.read_csv("src/analogy/data/sample.csv")
+    data.loc[::7, "ETHNICITY"] = None
+    filepath = str(tmp_path / "sample.csv")
+    data.to_csv(filepath, index=False)
+
+    loaded = file_loader(
+        filepath,
+        usecols=["START_DATE", "ETHNICITY"],
+        date_cols=["START_DATE"],
+        date_format=date_format,
+        cache=False,
+    )
+
+    expected = pd.read_csv(filepath, usecols=["START_DATE", "ETHNICITY"])
+    assert loaded["ETHNICITY"].isna().sum() == expected["ETHNICITY"].isna().sum() > 0
+    # missing values must be NaN like pd.read_csv gives, not None.
+    assert loaded["ETHNICITY"][loaded["ETHNICITY"].isna()].map(type).eq(float).all()
+    pd.testing.assert_series_equal(loaded["ETHNICITY"], expected["ETHNICITY"])